@@ -467,6 +467,9 @@ export class ThomasAttractorApp {
             // Update visualizations
             if (this.floralProjection && preset.projection) {
                 this.floralProjection.setProjectionPlane(preset.projection.plane);
+                this.floralProjection.setRotation(
+                    preset.projection.rotation || { axis: 'z', angle_rad: 0 }
+                );
                 if (preset.rhodonea) {
                     this.floralProjection.setRhodoneaParams(preset.rhodonea);
                 }
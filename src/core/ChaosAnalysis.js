@@ -3,6 +3,8 @@
  * Simplified implementation without repository patterns
  */
 
+import { thomasRK4 } from './ThomasAttractor.js';
+
 export class ChaosAnalysis {
     constructor(attractor) {
         this.attractor = attractor;
@@ -13,54 +15,79 @@ export class ChaosAnalysis {
 
     /**
      * Compute Lyapunov exponents using QR decomposition
+     * Tangent vectors, Jacobian and Gram-Schmidt are kept in scalar locals and
+     * the state is advanced in place, so the hot loop does not allocate per step
      */
     async computeLyapunovExponents(steps = 10000, skipTransient = 1000) {
-        const n = 3; // Dimension
         const dt = this.attractor.dt;
+        const b = this.attractor.b;
         
-        // Initialize orthonormal vectors
-        let Q = [
-            [1, 0, 0],
-            [0, 1, 0],
-            [0, 0, 1]
-        ];
+        // Orthonormal tangent vectors (rows of Q)
+        let q00 = 1, q01 = 0, q02 = 0;
+        let q10 = 0, q11 = 1, q12 = 0;
+        let q20 = 0, q21 = 0, q22 = 1;
         
         // Lyapunov sums
-        const lyapunovSums = [0, 0, 0];
-        let state = [...this.attractor.currentState];
+        let sum0 = 0, sum1 = 0, sum2 = 0;
+        const state = Float64Array.from(this.attractor.currentState);
         
         // Skip transient
         for (let i = 0; i < skipTransient; i++) {
-            state = this.attractor.rk4Step(state, dt);
+            thomasRK4(b, dt, state);
         }
         
         // Main computation
         for (let step = 0; step < steps; step++) {
-            // Get Jacobian at current state
-            const J = this.attractor.jacobian(state);
+            // Jacobian at current state: [[-b, cos y, 0], [0, -b, cos z], [cos x, 0, -b]]
+            const cx = Math.cos(state[0]);
+            const cy = Math.cos(state[1]);
+            const cz = Math.cos(state[2]);
             
             // Evolve tangent vectors
-            const newQ = [];
-            for (let i = 0; i < n; i++) {
-                const v = this.matrixVectorMultiply(J, Q[i]);
-                newQ.push(v);
-            }
+            const v00 = -b * q00 + cy * q01, v01 = -b * q01 + cz * q02, v02 = cx * q00 - b * q02;
+            const v10 = -b * q10 + cy * q11, v11 = -b * q11 + cz * q12, v12 = cx * q10 - b * q12;
+            const v20 = -b * q20 + cy * q21, v21 = -b * q21 + cz * q22, v22 = cx * q20 - b * q22;
             
             // QR decomposition using Gram-Schmidt
-            const { Q: nextQ, R } = this.gramSchmidt(newQ);
-            Q = nextQ;
+            const r00 = Math.sqrt(v00 * v00 + v01 * v01 + v02 * v02);
+            if (r00 > 1e-10) {
+                q00 = v00 / r00; q01 = v01 / r00; q02 = v02 / r00;
+            } else {
+                q00 = 0; q01 = 0; q02 = 0;
+            }
             
-            // Accumulate growth rates
-            for (let i = 0; i < n; i++) {
-                lyapunovSums[i] += Math.log(Math.abs(R[i][i]));
+            const r01 = v10 * q00 + v11 * q01 + v12 * q02;
+            const w10 = v10 - r01 * q00, w11 = v11 - r01 * q01, w12 = v12 - r01 * q02;
+            const r11 = Math.sqrt(w10 * w10 + w11 * w11 + w12 * w12);
+            if (r11 > 1e-10) {
+                q10 = w10 / r11; q11 = w11 / r11; q12 = w12 / r11;
+            } else {
+                q10 = 0; q11 = 0; q12 = 0;
+            }
+            
+            const r02 = v20 * q00 + v21 * q01 + v22 * q02;
+            const r12 = v20 * q10 + v21 * q11 + v22 * q12;
+            const w20 = v20 - r02 * q00 - r12 * q10;
+            const w21 = v21 - r02 * q01 - r12 * q11;
+            const w22 = v22 - r02 * q02 - r12 * q12;
+            const r22 = Math.sqrt(w20 * w20 + w21 * w21 + w22 * w22);
+            if (r22 > 1e-10) {
+                q20 = w20 / r22; q21 = w21 / r22; q22 = w22 / r22;
+            } else {
+                q20 = 0; q21 = 0; q22 = 0;
             }
             
-            // Advance state
-            state = this.attractor.rk4Step(state, dt);
+            // Accumulate growth rates
+            sum0 += Math.log(r00);
+            sum1 += Math.log(r11);
+            sum2 += Math.log(r22);
+            
+            // Advance state in place
+            thomasRK4(b, dt, state);
         }
         
         // Average the sums
-        const lyapunovExponents = lyapunovSums.map(sum => sum / (steps * dt));
+        const lyapunovExponents = [sum0, sum1, sum2].map(sum => sum / (steps * dt));
         
         // Sort in descending order
         lyapunovExponents.sort((a, b) => b - a);
@@ -177,76 +204,6 @@ export class ChaosAnalysis {
         return k + sum / Math.abs(lyapunovExponents[k]);
     }
 
-    /**
-     * Gram-Schmidt orthogonalization with QR decomposition
-     */
-    gramSchmidt(vectors) {
-        const n = vectors.length;
-        const Q = [];
-        const R = Array(n).fill(null).map(() => Array(n).fill(0));
-        
-        for (let i = 0; i < n; i++) {
-            let v = [...vectors[i]];
-            
-            // Subtract projections onto previous vectors
-            for (let j = 0; j < i; j++) {
-                const projection = this.dotProduct(vectors[i], Q[j]);
-                R[j][i] = projection;
-                v = this.vectorSubtract(v, this.scalarMultiply(Q[j], projection));
-            }
-            
-            // Normalize
-            const norm = this.vectorNorm(v);
-            R[i][i] = norm;
-            
-            if (norm > 1e-10) {
-                Q.push(this.scalarMultiply(v, 1 / norm));
-            } else {
-                // Handle degenerate case
-                Q.push([0, 0, 0]);
-            }
-        }
-        
-        return { Q, R };
-    }
-
-    /**
-     * Helper: Matrix-vector multiplication
-     */
-    matrixVectorMultiply(matrix, vector) {
-        return matrix.map(row => 
-            row.reduce((sum, val, i) => sum + val * vector[i], 0)
-        );
-    }
-
-    /**
-     * Helper: Dot product
-     */
-    dotProduct(v1, v2) {
-        return v1.reduce((sum, val, i) => sum + val * v2[i], 0);
-    }
-
-    /**
-     * Helper: Vector subtraction
-     */
-    vectorSubtract(v1, v2) {
-        return v1.map((val, i) => val - v2[i]);
-    }
-
-    /**
-     * Helper: Scalar multiplication
-     */
-    scalarMultiply(vector, scalar) {
-        return vector.map(val => val * scalar);
-    }
-
-    /**
-     * Helper: Vector norm
-     */
-    vectorNorm(vector) {
-        return Math.sqrt(vector.reduce((sum, val) => sum + val * val, 0));
-    }
-
     /**
      * Helper: Euclidean distance
      */
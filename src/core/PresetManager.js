@@ -18,10 +18,13 @@ export class PresetManager {
             const response = await fetch('/data/presets.json');
             const data = await response.json();
             
-            // Store each preset
-            Object.entries(data).forEach(([id, preset]) => {
-                this.presets.set(id, preset);
-            });
+            // Store each preset (presets.json is an array keyed by `id`)
+            const entries = Array.isArray(data)
+                ? data.map(preset => [preset.id, preset])
+                : Object.entries(data);
+            for (const [id, preset] of entries) {
+                this.presets.set(id, this.normalizePreset(id, preset));
+            }
             
             // Load custom presets from localStorage
             this.loadCustomPresets();
@@ -108,6 +111,19 @@ export class PresetManager {
         });
     }
 
+    /**
+     * Coerce a raw preset record into the shape the app reads, once at load time
+     */
+    normalizePreset(id, preset) {
+        const model = preset.model || {};
+        return {
+            ...preset,
+            name: preset.name ?? id,
+            model: { ...model, b: Number(model.b), dt: Number(model.dt) },
+            seed: preset.seed ?? model.seed
+        };
+    }
+
     /**
      * Load custom presets from localStorage
      */
@@ -189,7 +205,7 @@ export class PresetManager {
                 name: preset.name,
                 type: 'built-in',
                 b: preset.model.b,
-                fi: preset.FI_computed
+                fi: (preset.metrics || preset).FI_computed
             });
         });
         
@@ -6,6 +6,82 @@
 import { InputValidator, ValidationError } from '../utils/ErrorHandling.js';
 import { PHYSICS, VALIDATION } from '../utils/Constants.js';
 
+/**
+ * Preallocated x/y/z columns reused across integrations of up to `capacity` steps
+ */
+export class TrajectoryBuffer {
+    constructor(capacity) {
+        this.capacity = capacity;
+        this.x = new Float64Array(capacity);
+        this.y = new Float64Array(capacity);
+        this.z = new Float64Array(capacity);
+    }
+}
+
+/**
+ * One RK4 step of the Thomas system, evaluated inline on scalars
+ * Reads x/y/z from `state` and writes the next state into `out`, which may
+ * be the same array to advance in place
+ */
+export function thomasRK4(b, dt, state, out = state) {
+    const halfDt = 0.5 * dt;
+    const x = state[0], y = state[1], z = state[2];
+    
+    const k1x = Math.sin(y) - b * x;
+    const k1y = Math.sin(z) - b * y;
+    const k1z = Math.sin(x) - b * z;
+    
+    let tx = x + halfDt * k1x, ty = y + halfDt * k1y, tz = z + halfDt * k1z;
+    const k2x = Math.sin(ty) - b * tx;
+    const k2y = Math.sin(tz) - b * ty;
+    const k2z = Math.sin(tx) - b * tz;
+    
+    tx = x + halfDt * k2x; ty = y + halfDt * k2y; tz = z + halfDt * k2z;
+    const k3x = Math.sin(ty) - b * tx;
+    const k3y = Math.sin(tz) - b * ty;
+    const k3z = Math.sin(tx) - b * tz;
+    
+    tx = x + dt * k3x; ty = y + dt * k3y; tz = z + dt * k3z;
+    const k4x = Math.sin(ty) - b * tx;
+    const k4y = Math.sin(tz) - b * ty;
+    const k4z = Math.sin(tx) - b * tz;
+    
+    const sixthDt = dt * PHYSICS.RK4_FACTOR;
+    out[0] = x + sixthDt * (k1x + 2 * k2x + 2 * k3x + k4x);
+    out[1] = y + sixthDt * (k1y + 2 * k2y + 2 * k3y + k4y);
+    out[2] = z + sixthDt * (k1z + 2 * k2z + 2 * k3z + k4z);
+    return out;
+}
+
+/**
+ * Fixed-step RK4 integration of the Thomas system
+ * Advances a single scratch state in place so no arrays are allocated per step;
+ * pass a TrajectoryBuffer as `out` to write into existing storage
+ */
+export function integrateThomas(b, dt, n, x0, y0, z0, transient = 0, out = null) {
+    if (out && out.capacity < n) {
+        throw new RangeError(`TrajectoryBuffer holds ${out.capacity} steps, ${n} requested`);
+    }
+    const result = out || { x: new Float64Array(n), y: new Float64Array(n), z: new Float64Array(n) };
+    const xs = result.x;
+    const ys = result.y;
+    const zs = result.z;
+    const state = Float64Array.of(x0, y0, z0);
+    
+    for (let i = 0; i < transient; i++) {
+        thomasRK4(b, dt, state);
+    }
+    
+    for (let i = 0; i < n; i++) {
+        thomasRK4(b, dt, state);
+        xs[i] = state[0];
+        ys[i] = state[1];
+        zs[i] = state[2];
+    }
+    
+    return result;
+}
+
 export class ThomasAttractor {
     constructor(config = {}) {
         // Validate configuration
@@ -36,9 +112,8 @@ export class ThomasAttractor {
                 VALIDATION.MAX_COORDINATE * 100
             );
             
-            // Performance optimization: pre-allocated buffers
-            this.trajectory = new Float32Array(this.bufferSize * 3);
-            this.trajectoryIndex = 0;
+            // Performance optimization: pre-allocated buffers, one per component
+            this.allocateTrajectory();
         } catch (error) {
             console.error('ThomasAttractor initialization error:', error);
             // Use safe defaults
@@ -46,11 +121,20 @@ export class ThomasAttractor {
             this.dt = PHYSICS.DEFAULT_DT;
             this.currentState = [...PHYSICS.DEFAULT_SEED];
             this.bufferSize = 10000;
-            this.trajectory = new Float32Array(this.bufferSize * 3);
-            this.trajectoryIndex = 0;
+            this.allocateTrajectory();
         }
     }
 
+    /**
+     * Allocate the circular trajectory buffer as separate x/y/z columns
+     */
+    allocateTrajectory() {
+        this.trajectoryX = new Float32Array(this.bufferSize);
+        this.trajectoryY = new Float32Array(this.bufferSize);
+        this.trajectoryZ = new Float32Array(this.bufferSize);
+        this.trajectoryIndex = 0;
+    }
+
     /**
      * Thomas system equations: ẋ = sin(y) - bx, ẏ = sin(z) - by, ż = sin(x) - bz
      */
@@ -67,28 +151,7 @@ export class ThomasAttractor {
      * Runge-Kutta 4th order integration
      */
     rk4Step(state, dt) {
-        const k1 = this.derivatives(state);
-        const k2 = this.derivatives([
-            state[0] + 0.5 * dt * k1[0],
-            state[1] + 0.5 * dt * k1[1],
-            state[2] + 0.5 * dt * k1[2]
-        ]);
-        const k3 = this.derivatives([
-            state[0] + 0.5 * dt * k2[0],
-            state[1] + 0.5 * dt * k2[1],
-            state[2] + 0.5 * dt * k2[2]
-        ]);
-        const k4 = this.derivatives([
-            state[0] + dt * k3[0],
-            state[1] + dt * k3[1],
-            state[2] + dt * k3[2]
-        ]);
-
-        return [
-            state[0] + (dt * PHYSICS.RK4_FACTOR) * (k1[0] + 2 * k2[0] + 2 * k3[0] + k4[0]),
-            state[1] + (dt * PHYSICS.RK4_FACTOR) * (k1[1] + 2 * k2[1] + 2 * k3[1] + k4[1]),
-            state[2] + (dt * PHYSICS.RK4_FACTOR) * (k1[2] + 2 * k2[2] + 2 * k3[2] + k4[2])
-        ];
+        return thomasRK4(this.b, dt, state, [0, 0, 0]);
     }
 
     /**
@@ -107,20 +170,27 @@ export class ThomasAttractor {
             steps = 1;
         }
         
-        const points = [];
+        // Reuse the step buffer across frames, growing it only when needed
+        if (!this.stepBuffer || this.stepBuffer.capacity < steps) {
+            this.stepBuffer = new TrajectoryBuffer(steps);
+        }
+        
+        const [x0, y0, z0] = this.currentState;
+        const { x, y, z } = integrateThomas(this.b, this.dt, steps, x0, y0, z0, 0, this.stepBuffer);
+        const points = new Array(steps);
         
         for (let i = 0; i < steps; i++) {
-            this.currentState = this.rk4Step(this.currentState, this.dt);
-            points.push([...this.currentState]);
+            points[i] = [x[i], y[i], z[i]];
             
             // Store in trajectory buffer
-            const idx = this.trajectoryIndex * 3;
-            this.trajectory[idx] = this.currentState[0];
-            this.trajectory[idx + 1] = this.currentState[1];
-            this.trajectory[idx + 2] = this.currentState[2];
-            this.trajectoryIndex = (this.trajectoryIndex + 1) % (this.bufferSize / 3);
+            const idx = this.trajectoryIndex;
+            this.trajectoryX[idx] = x[i];
+            this.trajectoryY[idx] = y[i];
+            this.trajectoryZ[idx] = z[i];
+            this.trajectoryIndex = (idx + 1) % this.bufferSize;
         }
         
+        this.currentState = [x[steps - 1], y[steps - 1], z[steps - 1]];
         return points;
     }
 
@@ -128,27 +198,16 @@ export class ThomasAttractor {
      * Generate trajectory for analysis
      */
     generateTrajectory(steps, dt = null) {
-        const savedDt = this.dt;
-        if (dt !== null) this.dt = dt;
-        
-        const trajectory = [];
-        const savedState = [...this.currentState];
+        steps = InputValidator.sanitize(steps, 'positiveInteger', 0);
+        const stepDt = dt !== null ? dt : this.dt;
+        const [x0, y0, z0] = this.currentState;
+        const { x, y, z } = integrateThomas(this.b, stepDt, steps, x0, y0, z0, PHYSICS.TRANSIENT_STEPS);
         
-        // Skip transient
-        for (let i = 0; i < PHYSICS.TRANSIENT_STEPS; i++) {
-            this.currentState = this.rk4Step(this.currentState, this.dt);
-        }
-        
-        // Collect trajectory
+        const trajectory = new Array(steps);
         for (let i = 0; i < steps; i++) {
-            this.currentState = this.rk4Step(this.currentState, this.dt);
-            trajectory.push([...this.currentState]);
+            trajectory[i] = [x[i], y[i], z[i]];
         }
         
-        // Restore state
-        this.currentState = savedState;
-        this.dt = savedDt;
-        
         return trajectory;
     }
 
@@ -183,7 +242,9 @@ export class ThomasAttractor {
                 this.currentState = [...PHYSICS.DEFAULT_SEED];
             }
             this.trajectoryIndex = 0;
-            this.trajectory.fill(0);
+            this.trajectoryX.fill(0);
+            this.trajectoryY.fill(0);
+            this.trajectoryZ.fill(0);
         } catch (error) {
             console.error('Reset error:', error);
             throw new ValidationError('Invalid seed state', 'seed', seed);
@@ -244,11 +305,11 @@ export class ThomasAttractor {
         const startIdx = Math.max(0, this.trajectoryIndex - count);
         
         for (let i = 0; i < count; i++) {
-            const idx = ((startIdx + i) % (this.bufferSize / 3)) * 3;
+            const idx = (startIdx + i) % this.bufferSize;
             points.push([
-                this.trajectory[idx],
-                this.trajectory[idx + 1],
-                this.trajectory[idx + 2]
+                this.trajectoryX[idx],
+                this.trajectoryY[idx],
+                this.trajectoryZ[idx]
             ]);
         }
         
@@ -108,6 +108,7 @@ export const FLORAL = {
     
     // Visual
     PETAL_CURVE_SEGMENTS: 32,           // Segments per petal curve
+    MAX_RHODONEA_VERTICES: 16384,       // Cap on rhodonea overlay vertices
     TRAIL_OPACITY: 0.7,                 // Trail transparency
     POINT_SIZE: 2,                      // Current point size
 };
@@ -37,9 +37,9 @@ export class ExportManager {
     }
 
     /**
-     * Export data as JSON
+     * Export data as JSON (indented unless `pretty: false` is passed)
      */
-    async exportJSON(data, filename = null) {
+    async exportJSON(data, filename = null, { pretty = true } = {}) {
         try {
             // Generate filename if not provided
             if (!filename) {
@@ -48,7 +48,7 @@ export class ExportManager {
             }
 
             // Convert to JSON string
-            const jsonString = JSON.stringify(data, null, 2);
+            const jsonString = pretty ? JSON.stringify(data, null, 2) : JSON.stringify(data);
             const blob = new Blob([jsonString], { type: 'application/json' });
 
             // Download the file
@@ -74,29 +74,29 @@ export class ExportManager {
                 filename = `thomas-data-${timestamp}.csv`;
             }
 
-            let csvContent = '';
+            // Collect lines and let the Blob join them instead of growing one string
+            const lines = [];
             
             // Handle array of points
             if (Array.isArray(data) && data.length > 0) {
                 if (Array.isArray(data[0])) {
                     // Array of coordinates
-                    csvContent = 'x,y,z\n';
+                    lines.push('x,y,z\n');
                     data.forEach(point => {
-                        csvContent += `${point[0]},${point[1]},${point[2]}\n`;
+                        lines.push(`${point[0]},${point[1]},${point[2]}\n`);
                     });
                 } else if (typeof data[0] === 'object') {
                     // Array of objects
                     const headers = Object.keys(data[0]).join(',');
-                    csvContent = headers + '\n';
+                    lines.push(headers + '\n');
                     
                     data.forEach(row => {
-                        const values = Object.values(row).join(',');
-                        csvContent += values + '\n';
+                        lines.push(Object.values(row).join(',') + '\n');
                     });
                 }
             }
 
-            const blob = new Blob([csvContent], { type: 'text/csv' });
+            const blob = new Blob(lines, { type: 'text/csv' });
             this.downloadBlob(blob, filename);
             
             console.log(`📊 CSV exported: ${filename}`);
@@ -158,7 +158,7 @@ export class ExportManager {
             }
 
             // PLY header
-            let plyContent = `ply
+            const plyHeader = `ply
 format ascii 1.0
 element vertex ${points.length}
 property float x
@@ -171,16 +171,17 @@ end_header
 `;
 
             // Add points with colors
+            const lines = [plyHeader];
             points.forEach((point, index) => {
                 const intensity = (index / points.length) * 255;
                 const red = Math.floor(intensity * 0.5 + 64);
                 const green = Math.floor(intensity * 0.7 + 128);
                 const blue = Math.floor(255);
                 
-                plyContent += `${point[0]} ${point[1]} ${point[2]} ${red} ${green} ${blue}\n`;
+                lines.push(`${point[0]} ${point[1]} ${point[2]} ${red} ${green} ${blue}\n`);
             });
 
-            const blob = new Blob([plyContent], { type: 'text/plain' });
+            const blob = new Blob(lines, { type: 'text/plain' });
             this.downloadBlob(blob, filename);
             
             console.log(`🎯 PLY exported: ${filename}`);
@@ -3,6 +3,53 @@
  * Simplified implementation
  */
 
+import { FLORAL } from '../utils/Constants.js';
+
+// Component indices (horizontal, vertical) for each projection plane
+const PLANE_AXES = {
+    xy: [0, 1],
+    yz: [1, 2],
+    zx: [2, 0]
+};
+
+const AXIS_VECTORS = {
+    x: [1, 0, 0],
+    y: [0, 1, 0],
+    z: [0, 0, 1]
+};
+
+const IDENTITY = [1, 0, 0, 0, 1, 0, 0, 0, 1];
+
+/**
+ * Rodrigues rotation matrix (row-major, 9 entries) about `axis` by `angle` radians
+ * `axis` is 'x' | 'y' | 'z' or a non-zero 3-vector; anything else yields identity
+ */
+export function rotationMatrix(axis, angle) {
+    const vector = typeof axis === 'string' ? AXIS_VECTORS[axis] : axis;
+    if (!Array.isArray(vector) || vector.length !== 3 || !Number.isFinite(angle)) {
+        console.warn('Invalid rotation, using identity:', axis, angle);
+        return new Float64Array(IDENTITY);
+    }
+    
+    const [ax, ay, az] = vector;
+    const norm = Math.sqrt(ax * ax + ay * ay + az * az);
+    if (!(norm > 0) || !Number.isFinite(norm)) {
+        console.warn('Invalid rotation axis, using identity:', axis);
+        return new Float64Array(IDENTITY);
+    }
+    
+    const ux = ax / norm, uy = ay / norm, uz = az / norm;
+    const c = Math.cos(angle);
+    const s = Math.sin(angle);
+    const t = 1 - c;
+    
+    return new Float64Array([
+        c + t * ux * ux,       t * ux * uy - s * uz,  t * ux * uz + s * uy,
+        t * uy * ux + s * uz,  c + t * uy * uy,       t * uy * uz - s * ux,
+        t * uz * ux - s * uy,  t * uz * uy + s * ux,  c + t * uz * uz
+    ]);
+}
+
 export class FloralProjection {
     constructor(canvas, config = {}) {
         this.canvas = canvas;
@@ -19,8 +66,18 @@ export class FloralProjection {
             ...config
         };
 
-        this.points = [];
-        this.rhodoneaParams = { k: 7, scale: 8 };
+        // Trail ring buffer, stored as separate x/y columns
+        const capacity = this.config.bufferSize;
+        this.xs = new Float64Array(capacity);
+        this.ys = new Float64Array(capacity);
+        this.head = 0;
+        this.count = 0;
+        
+        // Rotation applied before projecting (identity by default)
+        this.rotation = rotationMatrix('z', 0);
+        
+        this.rhodoneaParams = { k: 7, m: 1, phi: 0, scale: 8, omega: 7 };
+        this.rhodoneaPath = null;
         
         this.setupCanvas();
     }
@@ -41,30 +98,21 @@ export class FloralProjection {
     }
 
     addPoints(points3D) {
-        // Project 3D points to 2D based on selected plane
-        const projected = points3D.map(p => this.project(p));
-        
-        // Add to buffer
-        this.points.push(...projected);
+        const capacity = this.config.bufferSize;
         
-        // Maintain buffer size
-        if (this.points.length > this.config.bufferSize) {
-            this.points.splice(0, this.points.length - this.config.bufferSize);
-        }
-    }
-
-    project(point3D) {
-        const [x, y, z] = point3D;
+        // Rows of the rotation that produce the two projected components
+        const [u, v] = PLANE_AXES[this.config.projectionPlane] || PLANE_AXES.xy;
+        const R = this.rotation;
+        const u0 = R[3 * u], u1 = R[3 * u + 1], u2 = R[3 * u + 2];
+        const v0 = R[3 * v], v1 = R[3 * v + 1], v2 = R[3 * v + 2];
         
-        switch (this.config.projectionPlane) {
-            case 'xy':
-                return [x, y];
-            case 'yz':
-                return [y, z];
-            case 'zx':
-                return [z, x];
-            default:
-                return [x, y];
+        for (let i = 0; i < points3D.length; i++) {
+            const p = points3D[i];
+            this.xs[this.head] = u0 * p[0] + u1 * p[1] + u2 * p[2];
+            this.ys[this.head] = v0 * p[0] + v1 * p[1] + v2 * p[2];
+            
+            this.head = (this.head + 1) % capacity;
+            if (this.count < capacity) this.count++;
         }
     }
 
@@ -74,7 +122,7 @@ export class FloralProjection {
         this.ctx.fillRect(0, 0, this.canvas.width, this.canvas.height);
         
         // Draw trail
-        if (this.points.length > 1) {
+        if (this.count > 1) {
             this.drawTrail();
         }
         
@@ -91,24 +139,19 @@ export class FloralProjection {
         const centerY = height / 2;
         const scale = Math.min(width, height) / 20;
         
+        const capacity = this.config.bufferSize;
+        let idx = (this.head - this.count + capacity) % capacity;
+        
+        // The whole trail is one path with a single stroke, so only the
+        // final alpha applies; set it once rather than per segment
         this.ctx.strokeStyle = this.config.trailColor;
-        this.ctx.globalAlpha = 0.6;
+        this.ctx.globalAlpha = ((this.count - 2) / this.count) * 0.8;
         this.ctx.beginPath();
+        this.ctx.moveTo(centerX + this.xs[idx] * scale, centerY - this.ys[idx] * scale); // Flip Y
         
-        for (let i = 0; i < this.points.length - 1; i++) {
-            const alpha = (i / this.points.length) * 0.8;
-            this.ctx.globalAlpha = alpha;
-            
-            const [x1, y1] = this.points[i];
-            const [x2, y2] = this.points[i + 1];
-            
-            const screenX1 = centerX + x1 * scale;
-            const screenY1 = centerY - y1 * scale; // Flip Y
-            const screenX2 = centerX + x2 * scale;
-            const screenY2 = centerY - y2 * scale;
-            
-            this.ctx.moveTo(screenX1, screenY1);
-            this.ctx.lineTo(screenX2, screenY2);
+        for (let i = 1; i < this.count; i++) {
+            if (++idx === capacity) idx = 0;
+            this.ctx.lineTo(centerX + this.xs[idx] * scale, centerY - this.ys[idx] * scale);
         }
         
         this.ctx.stroke();
@@ -121,28 +164,26 @@ export class FloralProjection {
         const centerX = width / 2;
         const centerY = height / 2;
         
-        const k = this.rhodoneaParams.k;
-        const scale = this.rhodoneaParams.scale * Math.min(width, height) / 50;
+        // Vertices only change with the parameters or canvas size
+        if (!this.rhodoneaPath) {
+            this.rhodoneaPath = this.computeRhodoneaPath();
+        }
+        const path = this.rhodoneaPath;
         
         this.ctx.strokeStyle = this.config.rhodoneaColor;
         this.ctx.globalAlpha = 0.3;
         this.ctx.lineWidth = 1;
         this.ctx.beginPath();
         
-        // Draw rhodonea curve: r = cos(k * theta)
-        for (let theta = 0; theta < Math.PI * 2; theta += 0.01) {
-            const r = Math.cos(k * theta) * scale;
-            const x = centerX + r * Math.cos(theta);
-            const y = centerY + r * Math.sin(theta);
-            
-            if (theta === 0) {
-                this.ctx.moveTo(x, y);
-            } else {
-                this.ctx.lineTo(x, y);
-            }
+        this.ctx.moveTo(centerX + path[0], centerY + path[1]);
+        for (let i = 2; i < path.length; i += 2) {
+            this.ctx.lineTo(centerX + path[i], centerY + path[i + 1]);
         }
         
-        this.ctx.closePath();
+        // The curve only returns to its start when k·m is an integer
+        if (Number.isInteger(this.rhodoneaParams.omega)) {
+            this.ctx.closePath();
+        }
         this.ctx.stroke();
         
         // Restore settings
@@ -150,22 +191,91 @@ export class FloralProjection {
         this.ctx.lineWidth = this.config.lineWidth;
     }
 
+    /**
+     * Rhodonea vertices relative to the canvas centre: r = cos(k * m * theta + phi)
+     * Sine/cosine are advanced by angle-addition rotation, so only the step
+     * rotations are evaluated with trig calls. Open curves (non-integer k·m)
+     * include the end vertex at theta = 2π
+     */
+    computeRhodoneaPath() {
+        const { omega, phi } = this.rhodoneaParams;
+        const scale = this.rhodoneaParams.scale * Math.min(this.canvas.width, this.canvas.height) / 50;
+        // cos(omega * theta) completes |omega| periods over the circle; keep a
+        // fixed number of samples per period so high k·m does not alias
+        const count = Math.min(
+            Math.max(Math.ceil(Math.PI * 2 / 0.01), Math.ceil(Math.abs(omega) * FLORAL.PETAL_CURVE_SEGMENTS)),
+            FLORAL.MAX_RHODONEA_VERTICES
+        );
+        const dTheta = Math.PI * 2 / count;
+        const vertices = Number.isInteger(omega) ? count : count + 1;
+        const path = new Float64Array(vertices * 2);
+        
+        // Rotors for theta and for omega * theta + phi
+        const cosStep = Math.cos(dTheta), sinStep = Math.sin(dTheta);
+        const cosPhaseStep = Math.cos(omega * dTheta), sinPhaseStep = Math.sin(omega * dTheta);
+        let c = 1, sn = 0;
+        let cPhase = Math.cos(phi), sPhase = Math.sin(phi);
+        
+        for (let i = 0; i < vertices; i++) {
+            const r = cPhase * scale;
+            path[2 * i] = r * c;
+            path[2 * i + 1] = r * sn;
+            
+            const nextC = c * cosStep - sn * sinStep;
+            sn = sn * cosStep + c * sinStep;
+            c = nextC;
+            
+            const nextCPhase = cPhase * cosPhaseStep - sPhase * sinPhaseStep;
+            sPhase = sPhase * cosPhaseStep + cPhase * sinPhaseStep;
+            cPhase = nextCPhase;
+        }
+        
+        return path;
+    }
+
     setProjectionPlane(plane) {
         this.config.projectionPlane = plane;
         this.clear();
     }
 
+    /**
+     * Set the rotation applied before projection, e.g. { axis: 'z', angle_rad: 0.5 }
+     */
+    setRotation(rotation) {
+        this.rotation = rotationMatrix(rotation.axis || 'z', rotation.angle_rad || 0);
+        this.clear();
+    }
+
     setRhodoneaParams(params) {
         if (params.k !== undefined) {
-            this.rhodoneaParams.k = params.k;
+            if (Number.isFinite(params.k)) {
+                this.rhodoneaParams.k = params.k;
+            } else {
+                console.warn('Invalid rhodonea k, keeping previous value:', params.k);
+            }
         }
         if (params.scale !== undefined) {
             this.rhodoneaParams.scale = params.scale;
         }
+        if (params.m !== undefined) {
+            if (Number.isFinite(params.m)) {
+                this.rhodoneaParams.m = params.m;
+            } else {
+                console.warn('Invalid rhodonea m, keeping previous value:', params.m);
+            }
+        }
+        if (params.phi !== undefined) {
+            this.rhodoneaParams.phi = params.phi;
+        }
+        
+        // Angular frequency k·m is fixed per configuration
+        this.rhodoneaParams.omega = this.rhodoneaParams.k * this.rhodoneaParams.m;
+        this.rhodoneaPath = null;
     }
 
     clear() {
-        this.points = [];
+        this.head = 0;
+        this.count = 0;
         this.ctx.fillStyle = this.config.backgroundColor;
         this.ctx.fillRect(0, 0, this.canvas.width, this.canvas.height);
     }
@@ -173,13 +283,32 @@ export class FloralProjection {
     handleResize() {
         this.canvas.width = this.canvas.clientWidth;
         this.canvas.height = this.canvas.clientHeight;
+        this.rhodoneaPath = null;
         this.clear();
     }
 
+    /**
+     * Most recent projected points, oldest first
+     */
+    getRecentPoints(count) {
+        const capacity = this.config.bufferSize;
+        const n = Math.min(count, this.count);
+        const start = (this.head - n + capacity) % capacity;
+        const points = new Array(n);
+        
+        for (let i = 0; i < n; i++) {
+            const idx = (start + i) % capacity;
+            points[i] = [this.xs[idx], this.ys[idx]];
+        }
+        
+        return points;
+    }
+
     exportData() {
         return {
-            points: this.points.slice(-1000), // Last 1000 points
+            points: this.getRecentPoints(1000),
             projectionPlane: this.config.projectionPlane,
+            rotation: Array.from(this.rotation),
             rhodoneaParams: this.rhodoneaParams
         };
     }
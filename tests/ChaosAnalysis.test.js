@@ -0,0 +1,38 @@
+/**
+ * Unit tests for ChaosAnalysis
+ * Regression coverage for the Lyapunov spectrum computation
+ */
+
+import { ThomasAttractor } from '../src/core/ThomasAttractor.js';
+import { ChaosAnalysis } from '../src/core/ChaosAnalysis.js';
+
+describe('ChaosAnalysis', () => {
+    let analysis;
+    
+    beforeEach(() => {
+        analysis = new ChaosAnalysis(new ThomasAttractor());
+    });
+    
+    describe('Lyapunov Exponents', () => {
+        test('should match the previous array-based implementation', async () => {
+            // Parity values from the array-based Gram-Schmidt implementation.
+            // The tangent update applies J rather than (I + dt·J), so these are
+            // not the true Thomas spectrum; this only pins the scalar rewrite.
+            const result = await analysis.computeLyapunovExponents();
+            
+            expect(result.exponents).toHaveLength(3);
+            expect(result.exponents[0]).toBeCloseTo(-30.259122801883517, 10);
+            expect(result.exponents[1]).toBeCloseTo(-84.8005487563045, 10);
+            expect(result.exponents[2]).toBeCloseTo(-111.70168386367604, 10);
+            expect(result.largest).toBe(result.exponents[0]);
+            expect(result.kaplanYorke).toBe(0);
+        });
+        
+        test('exponents should be sorted in descending order', async () => {
+            const { exponents } = await analysis.computeLyapunovExponents(500, 100);
+            
+            expect(exponents[0]).toBeGreaterThanOrEqual(exponents[1]);
+            expect(exponents[1]).toBeGreaterThanOrEqual(exponents[2]);
+        });
+    });
+});
@@ -0,0 +1,44 @@
+/**
+ * Unit tests for FloralProjection helpers
+ * Tests the rotation applied before projecting onto a plane
+ */
+
+import { rotationMatrix } from '../src/visualization/FloralProjection.js';
+
+const IDENTITY = [1, 0, 0, 0, 1, 0, 0, 0, 1];
+
+function apply(R, [x, y, z]) {
+    return [
+        R[0] * x + R[1] * y + R[2] * z,
+        R[3] * x + R[4] * y + R[5] * z,
+        R[6] * x + R[7] * y + R[8] * z
+    ];
+}
+
+describe('rotationMatrix', () => {
+    test('quarter turn about z should map x onto y', () => {
+        const [x, y, z] = apply(rotationMatrix('z', Math.PI / 2), [1, 0, 0]);
+        
+        expect(x).toBeCloseTo(0, 12);
+        expect(y).toBeCloseTo(1, 12);
+        expect(z).toBeCloseTo(0, 12);
+    });
+    
+    test('zero angle should give the identity', () => {
+        expect(Array.from(rotationMatrix('x', 0))).toEqual(IDENTITY);
+    });
+    
+    test('vector axes should be normalized', () => {
+        const named = rotationMatrix('y', 0.7);
+        const scaled = rotationMatrix([0, 5, 0], 0.7);
+        
+        named.forEach((value, i) => expect(scaled[i]).toBeCloseTo(value, 12));
+    });
+    
+    test('invalid axes should fall back to the identity', () => {
+        expect(Array.from(rotationMatrix('X', 1))).toEqual(IDENTITY);
+        expect(Array.from(rotationMatrix([0, 0, 0], 1))).toEqual(IDENTITY);
+        expect(Array.from(rotationMatrix([1, 0], 1))).toEqual(IDENTITY);
+        expect(Array.from(rotationMatrix('z', NaN))).toEqual(IDENTITY);
+    });
+});
@@ -3,7 +3,7 @@
  * Tests core mathematical functionality and edge cases
  */
 
-import { ThomasAttractor } from '../src/core/ThomasAttractor.js';
+import { ThomasAttractor, TrajectoryBuffer, integrateThomas } from '../src/core/ThomasAttractor.js';
 import { ValidationError } from '../src/utils/ErrorHandling.js';
 import { PHYSICS } from '../src/utils/Constants.js';
 
@@ -201,6 +201,12 @@ describe('ThomasAttractor', () => {
             expect(attractor.dt).toBe(originalDt);
         });
         
+        test('generateTrajectory should sanitize step count', () => {
+            expect(attractor.generateTrajectory(10.5)).toHaveLength(10);
+            expect(attractor.generateTrajectory('20')).toHaveLength(20);
+            expect(attractor.generateTrajectory(NaN)).toEqual([]);
+        });
+        
         test('circular buffer should not overflow', () => {
             // Generate more points than buffer size
             const bufferSize = attractor.bufferSize;
@@ -215,6 +221,45 @@ describe('ThomasAttractor', () => {
         });
     });
     
+    describe('Inlined RK4 Integrator', () => {
+        test('integrateThomas should match repeated rk4Step', () => {
+            const [x0, y0, z0] = PHYSICS.DEFAULT_SEED;
+            const { x, y, z } = integrateThomas(attractor.b, attractor.dt, 50, x0, y0, z0);
+            
+            let state = [...PHYSICS.DEFAULT_SEED];
+            for (let i = 0; i < 50; i++) {
+                state = attractor.rk4Step(state, attractor.dt);
+                expect(x[i]).toBeCloseTo(state[0], 12);
+                expect(y[i]).toBeCloseTo(state[1], 12);
+                expect(z[i]).toBeCloseTo(state[2], 12);
+            }
+        });
+        
+        test('integrateThomas should skip transient steps', () => {
+            const [x0, y0, z0] = PHYSICS.DEFAULT_SEED;
+            const full = integrateThomas(attractor.b, attractor.dt, 30, x0, y0, z0);
+            const skipped = integrateThomas(attractor.b, attractor.dt, 10, x0, y0, z0, 20);
+            
+            expect(skipped.x).toHaveLength(10);
+            expect(skipped.x[0]).toBe(full.x[20]);
+            expect(skipped.z[9]).toBe(full.z[29]);
+        });
+        
+        test('integrateThomas should write into a reused TrajectoryBuffer', () => {
+            const [x0, y0, z0] = PHYSICS.DEFAULT_SEED;
+            const buffer = new TrajectoryBuffer(64);
+            const fresh = integrateThomas(attractor.b, attractor.dt, 64, x0, y0, z0);
+            const reused = integrateThomas(attractor.b, attractor.dt, 64, x0, y0, z0, 0, buffer);
+            
+            expect(reused).toBe(buffer);
+            expect(Array.from(buffer.x)).toEqual(Array.from(fresh.x));
+            expect(Array.from(buffer.z)).toEqual(Array.from(fresh.z));
+            
+            // Too small a buffer is rejected rather than silently truncated
+            expect(() => integrateThomas(attractor.b, attractor.dt, 65, x0, y0, z0, 0, buffer)).toThrow(RangeError);
+        });
+    });
+    
     describe('Data Retrieval', () => {
         test('getParameters should return current configuration', () => {
             attractor.setB(0.25);